@@ -1,21 +1,25 @@
 __all__ = ["WorkspaceCleaner"]
 
-from typing import Optional
+import logging
+import threading
+from typing import Optional, Callable, List, Dict, Any, Tuple
+from multiprocessing.pool import ThreadPool
+from pyspark.sql.utils import AnalysisException
+from dbacademy import dbgems, common
+from dbacademy.clients.rest.common import DatabricksApiException
 from dbacademy.dbhelper import dbh_constants
 
 
 class WorkspaceCleaner:
 
     def __init__(self, db_academy_helper):
-        from dbacademy.common import validate
         from dbacademy.dbhelper.dbacademy_helper import DBAcademyHelper
 
-        self.__da = validate(db_academy_helper=db_academy_helper).required.as_type(DBAcademyHelper)
-        self.__unique_name: Optional[str] = None
+        self.__da = common.validate(db_academy_helper=db_academy_helper).required.as_type(DBAcademyHelper)
+        self.__unique_names: Dict[bool, str] = dict()
+        self.__print_lock = threading.Lock()
 
     def reset_lesson(self) -> None:
-        from dbacademy import dbgems
-
         status = False
         if self.__da.lesson_config.name is None:
             print(f"Resetting the learning environment:")
@@ -41,8 +45,6 @@ class WorkspaceCleaner:
             print("| No action taken")
 
     def reset_learning_environment(self) -> None:
-        from dbacademy import dbgems
-
         print("Resetting the learning environment for all lessons:")
 
         start = dbgems.clock_start()
@@ -56,113 +58,201 @@ class WorkspaceCleaner:
             self._cleanup_mlflow_models(lesson_only=False)
             self._cleanup_experiments(lesson_only=False)
 
+        # Must complete first so that no catalog or schema still references the directories removed below.
         self.__reset_databases()
 
-        self.__reset_datasets()
-        self.__reset_archives()
-        self.__reset_working_dir()
+        # A directory nested within one of the others is removed along with it, e.g. the datasets are installed
+        # under the working directory root. The rest are removed concurrently.
+        resets = [("datasets", self.__da.paths.datasets, self.__reset_datasets),
+                  ("archives", self.__da.paths.archives, self.__reset_archives),
+                  ("working directory root", self.__da.working_dir_root, self.__reset_working_dir)]
+        to_remove = []
+        for label, path, reset in resets:
+            parents = [parent_label for parent_label, parent, _ in resets if self._is_nested(path, parent)]
+            if len(parents) > 0:
+                print(f"| Deleting {label} \"{path}\" along with the {parents[0]}.")
+            else:
+                to_remove.append(reset)
 
-        self.__drop_instance_pool()
-        self.__drop_cluster_policies()
+        self.__run_concurrently(*to_remove)
+        self.__run_concurrently(self.__drop_instance_pool, self.__drop_cluster_policies)
 
         print(f"| The learning environment was successfully reset {dbgems.clock_stopped(start)}.")
 
+    @staticmethod
+    def __run_concurrently(*actions: Callable[[], None]) -> None:
+        with ThreadPool(len(actions)) as pool:
+            pool.map(lambda action: action(), actions)
+
+    def __print(self, message: str) -> None:
+        # Serializes output from methods that are run concurrently so that lines are not interleaved.
+        with self.__print_lock:
+            print(message)
+
     def __drop_instance_pool(self):
+        # Listed once and matched by name as get_by_name() and delete_by_name() would each list all pools again
+        pool_ids = {p.get("instance_pool_name"): p.get("instance_pool_id") for p in self.__da.client.instance_pools.list()}
 
-        for pool_name in dbh_constants.CLUSTERS_HELPER.POOLS:
-            pool = self.__da.client.instance_pools.get_by_name(pool_name)
-            if pool is not None:
-                print(f"| Dropping the instance pool \"{pool_name}\".")
-                self.__da.client.instance_pools.delete_by_name(pool_name)
+        def drop(pool_name: str) -> None:
+            self.__da.client.instance_pools.delete_by_id(pool_ids[pool_name])
+
+        pool_names = [n for n in dbh_constants.CLUSTERS_HELPER.POOLS if n in pool_ids]
+        self.__do_for_each("Dropping instance pools", drop, pool_names, 16)
 
     def __drop_cluster_policies(self):
+        policy_ids = {p.get("name"): p.get("policy_id") for p in self.__da.client.cluster_policies.list()}
 
-        for policy_name in dbh_constants.CLUSTERS_HELPER.POLICIES:
-            policy = self.__da.client.cluster_policies.get_by_name(policy_name)
-            if policy is not None:
-                print(f"| Dropping the cluster policy \"{policy_name}\".")
-                self.__da.client.cluster_policies.delete_by_name(policy_name)
+        def drop(policy_name: str) -> None:
+            self.__da.client.cluster_policies.delete_by_id(policy_ids[policy_name])
 
-    def __reset_working_dir(self) -> None:
-        from dbacademy import dbgems
-        from dbacademy.dbhelper.paths import Paths
+        policy_names = [n for n in dbh_constants.CLUSTERS_HELPER.POLICIES if n in policy_ids]
+        self.__do_for_each("Dropping cluster policies", drop, policy_names, 16)
 
-        print(f"| Deleting working directory root \"{self.__da.working_dir_root}\".")
-        if Paths.exists(self.__da.working_dir_root):
-            dbgems.dbutils.fs.rm(self.__da.working_dir_root, True)
+    def __do_for_each(self, action: str, f: Callable[[str], Any], names: List[str], max_workers: int) -> None:
+        """
+        Applies f to every name on a thread pool and then prints one summary of the outcomes, see _format_summary.
+        f may return False to indicate that there was nothing to do for that name. A failure does not abort the rest of
+        the batch, but once the summary is printed, the first failure is re-raised.
+        """
+        def attempt(name: str) -> Tuple[str, str, str, Optional[Exception]]:
+            start = dbgems.clock_start()
+            try:
+                status = "skipped" if f(name) is False else "done"
+                return name, status, dbgems.clock_stopped(start), None
+            except Exception as e:
+                return name, "failed", dbgems.clock_stopped(start), e
 
-    def __reset_datasets(self) -> None:
-        from dbacademy import dbgems
-        from dbacademy.dbhelper.paths import Paths
+        if len(names) == 0:
+            return
 
-        print(f"| Deleting datasets \"{self.__da.paths.datasets}\".")
-        if Paths.exists(self.__da.paths.datasets):
-            dbgems.dbutils.fs.rm(self.__da.paths.datasets, True)
+        with ThreadPool(min(len(names), max_workers)) as pool:
+            results = pool.map(attempt, names)
 
-    def __reset_archives(self) -> None:
-        from dbacademy import dbgems
-        from dbacademy.dbhelper.paths import Paths
+        self.__print(self._format_summary(action, results))
+
+        errors = [error for _, _, _, error in results if error is not None]
+        if len(errors) > 0:
+            raise errors[0]
+
+    @staticmethod
+    def _format_summary(action: str, results: List[Tuple[str, str, str, Optional[Exception]]]) -> str:
+        """
+        Formats the outcome of a batch as one line per item, grouped by status.
+        :param action: the description of what was done to each item, e.g. "Dropping cluster policies"
+        :param results: the (name, status, elapsed, error) of each item where status is one of "done", "skipped" or "failed"
+        :return: the newline-delimited summary
+        """
+        statuses = ["done", "skipped", "failed"]
+        grouped = {status: [r for r in results if r[1] == status] for status in statuses}
+
+        lines = [f"| {action} ({', '.join(f'{len(grouped[s])} {s}' for s in statuses)}):"]
+        for name, status, elapsed, error in [r for s in statuses for r in grouped[s]]:
+            line = f"|   {status} \"{name}\" {elapsed}"
+            if error is not None:
+                # Only the first line, API exceptions can include the server's multi-line response body.
+                message = str(error).strip().splitlines()
+                line += f": {message[0] if message else type(error).__name__}"
+            lines.append(line)
+
+        return "\n".join(lines)
+
+    @staticmethod
+    def _is_nested(path: str, parent: str) -> bool:
+        """
+        Compares the two paths as DBFS paths, that is, "dbfs:/a/b" and "/a/b" are the same.
+        :return: True if path is a descendant of, but not the same as, parent
+        """
+        def normalize(p: str) -> str:
+            return (p[len("dbfs:"):] if p.startswith("dbfs:") else p).rstrip("/")
 
-        print(f"| Deleting archives \"{self.__da.paths.archives}\".")
-        if Paths.exists(self.__da.paths.datasets):
-            dbgems.dbutils.fs.rm(self.__da.paths.archives, True)
+        return normalize(path).startswith(normalize(parent) + "/")
 
     @staticmethod
-    def __list_catalogs():
-        from dbacademy import dbgems
+    def __remove_dir(path: str) -> None:
+        try:
+            dbgems.dbutils.fs.rm(path, True)
+        except Exception:
+            pass  # Most likely already deleted, in which case there is nothing to remove
+
+    def __reset_working_dir(self) -> None:
+        self.__print(f"| Deleting working directory root \"{self.__da.working_dir_root}\".")
+        self.__remove_dir(self.__da.working_dir_root)
+
+    def __reset_datasets(self) -> None:
+        self.__print(f"| Deleting datasets \"{self.__da.paths.datasets}\".")
+        self.__remove_dir(self.__da.paths.datasets)
+
+    def __reset_archives(self) -> None:
+        self.__print(f"| Deleting archives \"{self.__da.paths.archives}\".")
+        self.__remove_dir(self.__da.paths.archives)
 
-        return [c.catalog for c in dbgems.spark.sql(f"SHOW CATALOGS").collect()]
+    @staticmethod
+    def __list_catalogs(pattern: str):
+        return [c.catalog for c in dbgems.spark.sql(f"SHOW CATALOGS LIKE '{pattern}'").collect()]
 
     def __reset_databases(self) -> None:
-        from dbacademy import dbgems
-        from pyspark.sql.utils import AnalysisException
+        sql = dbgems.spark.sql
+        catalog_prefix = self.__da.catalog_name_prefix
+        schema_prefix = self.__da.schema_name_prefix
+        schema_default = dbh_constants.DBACADEMY_HELPER.SCHEMA_DEFAULT
+        default_catalogs = [dbh_constants.DBACADEMY_HELPER.CATALOG_SPARK_DEFAULT,
+                            dbh_constants.DBACADEMY_HELPER.CATALOG_UC_DEFAULT]
+
+        # One listing, filtered server-side, of both the user-specific catalogs and whichever "default" catalogs exist
+        catalog_names = self.__list_catalogs("|".join([f"{catalog_prefix}*"] + default_catalogs))
 
         # Drop all user-specific catalogs
-        catalog_names = self.__list_catalogs()
-        for catalog_name in catalog_names:
-            if catalog_name.startswith(self.__da.catalog_name_prefix):
-                print(f"Dropping the catalog \"{catalog_name}\"")
-                try:
-                    dbgems.spark.sql(f"DROP CATALOG IF EXISTS {catalog_name} CASCADE")
-                except AnalysisException:
-                    pass  # Ignore this concurrency error
-
-        # Refresh the list of catalogs
-        catalog_names = self.__list_catalogs()
-        for catalog_name in catalog_names:
-            # There are potentially two "default" catalogs from which we need to remove user-specific schemas
-            if catalog_name in [dbh_constants.DBACADEMY_HELPER.CATALOG_SPARK_DEFAULT,
-                                dbh_constants.DBACADEMY_HELPER.CATALOG_UC_DEFAULT]:
-                schema_names = [d.databaseName for d in dbgems.spark.sql(f"SHOW DATABASES IN {catalog_name}").collect()]
-                for schema_name in schema_names:
-                    if schema_name.startswith(self.__da.schema_name_prefix) and schema_name != dbh_constants.DBACADEMY_HELPER.SCHEMA_DEFAULT:
-                        print(f"| Dropping the schema \"{catalog_name}.{schema_name}\"")
-                        self._drop_database(f"{catalog_name}.{schema_name}")
+        for catalog_name in [c for c in catalog_names if c not in default_catalogs]:
+            print(f"Dropping the catalog \"{catalog_name}\"")
+            try:
+                sql(f"DROP CATALOG IF EXISTS {catalog_name} CASCADE")
+            except AnalysisException:
+                pass  # Ignore this concurrency error
 
-    @staticmethod
-    def _drop_database(schema_name) -> None:
-        from dbacademy import dbgems
-        from pyspark.sql.utils import AnalysisException
+        # There are potentially two "default" catalogs from which we need to remove user-specific schemas. Neither
+        # matches the user-specific prefix, so the listing above is still accurate for them and need not be refreshed.
+        catalog_names = [c for c in catalog_names if c in default_catalogs]
+        if len(catalog_names) == 0:
+            return
 
-        try:
-            location = dbgems.sql(f"DESCRIBE TABLE EXTENDED {schema_name}").filter("col_name == 'Location'").first()["data_type"]
-        except Exception:
-            location = None  # Ignore this concurrency error
+        def list_schemas(catalog_name: str) -> List[str]:
+            return [d.databaseName for d in sql(f"SHOW DATABASES IN {catalog_name} LIKE '{schema_prefix}*'").collect()]
+
+        # The two catalogs are independent, so enumerate their schemas concurrently.
+        with ThreadPool(len(catalog_names)) as pool:
+            all_schema_names = pool.map(list_schemas, catalog_names)
+
+        targets = [f"{c}.{s}" for c, schema_names in zip(catalog_names, all_schema_names)
+                   for s in schema_names if s != schema_default]
+        if len(targets) == 0:
+            return
+
+        # Independent schemas can be dropped concurrently, bounded so as not to overwhelm the metastore. Each schema's
+        # location is under the working directory root which is removed wholesale right after this method, so there is
+        # no need to look up the location of each schema (a Spark job apiece) just to remove it here.
+        self.__do_for_each("Dropping schemas", lambda t: self._drop_database(t, remove_location=False), targets, 4)
+
+    @staticmethod
+    def _drop_database(schema_name: str, remove_location: bool = True) -> None:
+        location = None
+        if remove_location:
+            try:
+                location = dbgems.sql(f"DESCRIBE TABLE EXTENDED {schema_name}").filter("col_name == 'Location'").first()["data_type"]
+            except Exception:
+                pass  # Ignore this concurrency error
 
         try:
             dbgems.sql(f"DROP DATABASE IF EXISTS {schema_name} CASCADE")
         except AnalysisException:
             pass  # Ignore this concurrency error
 
-        try:
-            dbgems.dbutils.fs.rm(location)
-        except:
-            pass  # We are going to ignore this as it is most likely deleted or None
+        if location is not None:
+            try:
+                dbgems.dbutils.fs.rm(location)
+            except:
+                pass  # We are going to ignore this as it is most likely deleted
 
     def _drop_catalog(self) -> bool:
-        from dbacademy import dbgems
-        from pyspark.sql.utils import AnalysisException
-
         if not self.__da.lesson_config.create_catalog:
             return False  # If we don't create the catalog, don't drop it
 
@@ -177,12 +267,18 @@ class WorkspaceCleaner:
         print(dbgems.clock_stopped(start))
         return True
 
-    def _drop_schema(self) -> bool:
-        from dbacademy import dbgems
+    @staticmethod
+    def __database_exists(schema_name: str) -> bool:
+        if hasattr(dbgems.spark.catalog, "databaseExists"):
+            return dbgems.spark.catalog.databaseExists(schema_name)
+
+        # Catalog.databaseExists() was added in PySpark 3.3 and older runtimes are still supported
+        return dbgems.spark.sql(f"SHOW DATABASES").filter(f"databaseName == '{schema_name}'").count() > 0
 
+    def _drop_schema(self) -> bool:
         if self.__da.lesson_config.create_catalog:
             return False  # If we create the catalog, we don't drop the schema
-        elif dbgems.spark.sql(f"SHOW DATABASES").filter(f"databaseName == '{self.__da.schema_name}'").count() == 0:
+        elif not self.__database_exists(self.__da.schema_name):
             return False  # If the database doesn't exist, it cannot be dropped
 
         start = dbgems.clock_start()
@@ -195,8 +291,6 @@ class WorkspaceCleaner:
 
     @staticmethod
     def _stop_all_streams() -> bool:
-        from dbacademy import dbgems
-
         if len(dbgems.active_streams()) == 0:
             return False  # Bail if there are no active streams
 
@@ -213,8 +307,6 @@ class WorkspaceCleaner:
         return True
 
     def _cleanup_working_dir(self) -> bool:
-        from dbacademy import dbgems
-
         if not self.__da.paths.exists(self.__da.paths.working_dir):
             return False  # Bail if the directory doesn't exist
 
@@ -227,7 +319,6 @@ class WorkspaceCleaner:
         return True
 
     def _drop_feature_store_tables(self, lesson_only: bool) -> bool:
-        import logging
         # noinspection PyPackageRequirements
         from databricks import feature_store
 
@@ -243,35 +334,44 @@ class WorkspaceCleaner:
         logger.disabled = True
 
         try:
-            for table in feature_store_tables:
-                name = table.get("name")
-                print(f"| Dropping feature store table \"{name}\"")
-                feature_store.FeatureStoreClient().drop_table(name)
+            # The client is shared by all the workers, its construction loads the SDK's configuration and credentials
+            client = feature_store.FeatureStoreClient()
+            self.__do_for_each("Dropping feature store tables", client.drop_table, [t.get("name") for t in feature_store_tables], 8)
         finally:
             logger.disabled = logger_disabled
 
         return True
 
     def _get_unique_name(self, lesson_only: bool) -> str:
-        if self.__unique_name is not None:
-            return self.__unique_name
+        if lesson_only not in self.__unique_names:
+            if lesson_only:
+                self.__unique_names[lesson_only] = self.__da.unique_name("-")
+            else:
+                self.__unique_names[lesson_only] = self.__da.to_unique_name(lesson_config=self.__da.lesson_config, sep="-")
 
-        if lesson_only:
-            self.__unique_name = self.__da.unique_name("-")
-        else:
-            self.__unique_name = self.__da.to_unique_name(lesson_config=self.__da.lesson_config, sep="-")
+        return self.__unique_names[lesson_only]
 
-        return self.__unique_name
+    @staticmethod
+    def _is_unique_name_match(name: str, unique_name: str) -> bool:
+        """
+        A name pertains to this course and user when any of its underscore-delimited parts starts with the unique name.
+        Because the unique name never contains an underscore (see DBAcademyHelper.to_unique_name), that is the same as
+        finding the unique name either at the start of the name or immediately after an underscore.
+        :param name: the name of the model, endpoint or other asset
+        :param unique_name: the value of _get_unique_name()
+        :return: True if the name pertains to this course and user
+        """
+        return f"_{unique_name}" in f"_{name}"
 
     def _cleanup_experiments(self, lesson_only: bool) -> bool:
         import mlflow
         from mlflow.entities import ViewType
-        from dbacademy import dbgems
 
         start = dbgems.clock_start()
 
+        unique_name = self._get_unique_name(lesson_only)
         experiments = mlflow.search_experiments(view_type=ViewType.ACTIVE_ONLY)
-        experiments = [e for e in experiments if e.name.split("/")[-1].startswith(self._get_unique_name(lesson_only))]
+        experiments = [e for e in experiments if e.name.split("/")[-1].startswith(unique_name)]
 
         if len(experiments) == 0:
             return False
@@ -279,73 +379,54 @@ class WorkspaceCleaner:
         # Not our normal pattern, but the goal here is to report on ourselves only if experiments were found.
         print(f"| Enumerating MLflow Experiments...{dbgems.clock_stopped(start)}")
 
-        for experiment in experiments:
-            status = self.__da.client.workspace.get_status(experiment.name)
-            if status and status.get("object_type") == "MLFLOW_EXPERIMENT":
-                print(f"| Deleting experiment \"{experiment.name}\" ({experiment.experiment_id})")
-                mlflow.delete_experiment(experiment.experiment_id)
+        get_status = self.__da.client.workspace.get_status
+        delete_experiment = mlflow.delete_experiment
+        experiment_ids = {e.name: e.experiment_id for e in experiments}
+
+        def delete(name: str) -> bool:
+            status = get_status(name)
+            if not status or status.get("object_type") != "MLFLOW_EXPERIMENT":
+                return False  # Not a workspace experiment, leave it alone
+            delete_experiment(experiment_ids[name])
+            return True
+
+        self.__do_for_each("Deleting experiments", delete, list(experiment_ids), 16)
 
         return True
 
     def _cleanup_mlflow_models(self, lesson_only: bool) -> bool:
-        import time
-        from dbacademy import dbgems
-
-        models = []
         start = dbgems.clock_start()
 
         # Filter out the models that pertain to this course and user
         unique_name = self._get_unique_name(lesson_only)
-        for model in self.__da.client.ml.mlflow_models.list():
-            name = model.get("name")
-            for part in name.split("_"):
-                if lesson_only and unique_name == part:
-                    models.append(model)
-                    # print(f"| Matched model \"{name}\" against \"{unique_name}\" ({lesson_only})")
-                elif part.startswith(unique_name):
-                    models.append(model)
-                    # print(f"| Matched model \"{name}\" against \"{unique_name}\" ({lesson_only})")
+        models = [m for m in self.__da.client.ml.mlflow_models.list() if self._is_unique_name_match(m.get("name"), unique_name)]
 
         if len(models) == 0:
             return False
 
         # Not our normal pattern, but the goal here is to report on ourselves only if models were found.
         print(f"| Enumerating MLflow models...{dbgems.clock_stopped(start)}")
-        active_stages = ["production", "staging"]
 
-        for model in models:
-            start = dbgems.clock_start()
-            name = model.get("name")
-            print(f"| Deleting model {name}", end="...")
-
-            for version in self.__da.client.ml.mlflow_model_versions.list(name):
-                v = version.get("version")
-                stage = version.get("current_stage").lower()
-                if stage in active_stages:
-                    print(f" archiving model v{v}", end="...")
-                    self.__da.client.ml.mlflow_model_versions.transition_stage(name, v, "archived")
-
-            all_archived = False
-            while not all_archived:
-                all_archived = True  # Assume True at start
-                for version in self.__da.client.ml.mlflow_model_versions.list(name):
-                    if version.get("current_stage").lower() in active_stages:
-                        all_archived = False
-                        v = version.get("version")
-                        print(f" waiting for v{v}", end="...")
-                        time.sleep(5)
-
-            self.__da.client.ml.mlflow_models.delete_by_name(name)
-            print(dbgems.clock_stopped(start))
+        self.__do_for_each("Deleting models", self._purge_one_model, [m.get("name") for m in models], 8)
 
         return True
 
-    def _cleanup_mlflow_endpoints(self, lesson_only: bool) -> bool:
-        from dbacademy import dbgems, common
-        from dbacademy.clients.rest.common import DatabricksApiException
+    def _purge_one_model(self, name: str) -> None:
+        active_stages = ["production", "staging"]
+        versions_api = self.__da.client.ml.mlflow_model_versions
+
+        # A single snapshot is enough: transition-stage returns once the stage is updated, so there is no need to
+        # re-list the versions and wait for them to leave the active stages before deleting the model.
+        active_versions = [v.get("version") for v in versions_api.list(name) if v.get("current_stage").lower() in active_stages]
 
+        if len(active_versions) > 0:
+            with ThreadPool(len(active_versions)) as pool:
+                pool.map(lambda v: versions_api.transition_stage(name, v, "archived"), active_versions)
+
+        self.__da.client.ml.mlflow_models.delete_by_name(name)
+
+    def _cleanup_mlflow_endpoints(self, lesson_only: bool) -> bool:
         start = dbgems.clock_start()
-        endpoints = list()
 
         # Filter out the endpoints that pertain to this course and user
         unique_name = self._get_unique_name(lesson_only)
@@ -359,18 +440,7 @@ class WorkspaceCleaner:
             else:
                 raise e
 
-        for endpoint in existing_endpoints:
-            name = endpoint.get("name")
-            for part in name.split("_"):
-                if lesson_only and unique_name == part:
-                    endpoints.append(endpoint)
-                    # print(f"""| Adding "{name}" as full part matching "{part}".""")
-                elif part.startswith(unique_name):
-                    endpoints.append(endpoint)
-                    # print(f"""| Adding "{name}" as starts with "{unique_name}".""")
-                else:
-                    pass
-                    # print(f"""| Skipping "{name}".""")
+        endpoints = [e for e in existing_endpoints if self._is_unique_name_match(e.get("name"), unique_name)]
 
         # Not our normal pattern, but the goal here is to report on ourselves only if endpoints were found.
         print(f"| Enumerating serving endpoints...found {len(existing_endpoints)}...{dbgems.clock_stopped(start)}")
@@ -378,9 +448,7 @@ class WorkspaceCleaner:
         if len(endpoints) == 0:
             return False
 
-        for endpoint in endpoints:
-            name: str = endpoint.get("name")
-            print(f"| Disabling serving endpoint \"{name}\"")
-            self.__da.client.serving_endpoints.delete_by_name(name)
+        names = [e.get("name") for e in endpoints]
+        self.__do_for_each("Disabling serving endpoints", self.__da.client.serving_endpoints.delete_by_name, names, 16)
 
         return True
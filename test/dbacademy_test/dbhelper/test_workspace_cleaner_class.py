@@ -0,0 +1,73 @@
+__all__ = ["WorkspaceCleanerTests"]
+
+import unittest
+from dbacademy.dbhelper.workspace_cleaner import WorkspaceCleaner
+
+UNIQUE_NAME = "jdoe-1a2b-da-ml"
+
+
+def split_match(name: str, unique_name: str) -> bool:
+    # The rule previously used by _cleanup_mlflow_models and _cleanup_mlflow_endpoints, for both values of lesson_only
+    for part in name.split("_"):
+        if unique_name == part or part.startswith(unique_name):
+            return True
+    return False
+
+
+class WorkspaceCleanerTests(unittest.TestCase):
+
+    def test_unique_name_has_no_underscores(self):
+        from dbacademy import common
+
+        # DBAcademyHelper.to_unique_name relies on this to produce the unique name
+        self.assertNotIn("_", common.clean_string("j_doe 1a2b da ml_101 Some_Lesson", replacement="-"))
+
+    def test_is_unique_name_match(self):
+        names = [
+            UNIQUE_NAME,
+            f"{UNIQUE_NAME}_model",
+            f"model_{UNIQUE_NAME}",
+            f"model_{UNIQUE_NAME}-lesson-1_v2",
+            f"model__{UNIQUE_NAME}",
+            f"{UNIQUE_NAME}-lesson-1",
+            f"x{UNIQUE_NAME}_model",
+            f"model-{UNIQUE_NAME}",
+            f"model_x{UNIQUE_NAME}",
+            "jdoe-1a2b-da",
+            "some_other_model",
+            "",
+        ]
+        for name in names:
+            self.assertEqual(split_match(name, UNIQUE_NAME), WorkspaceCleaner._is_unique_name_match(name, UNIQUE_NAME), f"Mismatch for \"{name}\"")
+
+    def test_is_nested(self):
+        self.assertTrue(WorkspaceCleaner._is_nested("dbfs:/mnt/dbacademy-users/jdoe/ml/datasets", "dbfs:/mnt/dbacademy-users/jdoe/ml"))
+        self.assertTrue(WorkspaceCleaner._is_nested("dbfs:/mnt/dbacademy-users/jdoe/ml/datasets", "/mnt/dbacademy-users/jdoe/ml/"))
+        self.assertTrue(WorkspaceCleaner._is_nested("/mnt/dbacademy-users/jdoe/ml/datasets/", "dbfs:/mnt/dbacademy-users/jdoe/ml"))
+
+        self.assertFalse(WorkspaceCleaner._is_nested("dbfs:/mnt/dbacademy-users/jdoe/ml", "dbfs:/mnt/dbacademy-users/jdoe/ml"))
+        self.assertFalse(WorkspaceCleaner._is_nested("dbfs:/mnt/dbacademy-users/jdoe/ml", "dbfs:/mnt/dbacademy-users/jdoe/ml/"))
+        self.assertFalse(WorkspaceCleaner._is_nested("dbfs:/mnt/dbacademy-users/jdoe/ml-2/datasets", "dbfs:/mnt/dbacademy-users/jdoe/ml"))
+        self.assertFalse(WorkspaceCleaner._is_nested("dbfs:/mnt/dbacademy-datasets/ml/v01", "dbfs:/mnt/dbacademy-users/jdoe/ml"))
+
+    def test_format_summary(self):
+        results = [
+            ("policy-a", "failed", "(1 seconds)", Exception("Something went wrong\n{'error_code': 'INTERNAL_ERROR'}")),
+            ("policy-b", "done", "(0 seconds)", None),
+            ("policy-c", "skipped", "(0 seconds)", None),
+            ("policy-d", "done", "(2 seconds)", None),
+            ("policy-e", "failed", "(0 seconds)", ValueError()),
+        ]
+        expected = "\n".join([
+            "| Dropping cluster policies (2 done, 1 skipped, 2 failed):",
+            "|   done \"policy-b\" (0 seconds)",
+            "|   done \"policy-d\" (2 seconds)",
+            "|   skipped \"policy-c\" (0 seconds)",
+            "|   failed \"policy-a\" (1 seconds): Something went wrong",
+            "|   failed \"policy-e\" (0 seconds): ValueError",
+        ])
+        self.assertEqual(expected, WorkspaceCleaner._format_summary("Dropping cluster policies", results))
+
+
+if __name__ == '__main__':
+    unittest.main()